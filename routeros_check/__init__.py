@@ -1,6 +1,2 @@
 # SPDX-FileCopyrightText: PhiBo DinoTools (2021)
 # SPDX-License-Identifier: GPL-3.0-or-later
-
-from .helper import load_modules
-
-load_modules()
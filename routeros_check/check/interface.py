@@ -246,28 +246,27 @@ class InterfaceResource(RouterOSCheckResource):
         if self._interface_data:
             return self._interface_data
 
-        api = self._connect_api()
-
-        logger.info("Fetching data ...")
-        interface_ethernet_data = {}
-        interface_count = len(tuple(api.path("/interface/ethernet")))
-        call_results = tuple(api(
-            "/interface/ethernet/monitor",
-            **{
-                "once": "",
-                "numbers": f"{','.join([str(i) for i in range(interface_count)])}"
-            }
-        ))
-        for result in call_results:
-            if "rate" in result:
-                interface_ethernet_data[result["name"]] = {
-                    "speed": result["rate"],
+        with self._api_connection() as api:
+            logger.info("Fetching data ...")
+            interface_ethernet_data = {}
+            interface_count = len(tuple(api.path("/interface/ethernet")))
+            call_results = tuple(api(
+                "/interface/ethernet/monitor",
+                **{
+                    "once": "",
+                    "numbers": f"{','.join([str(i) for i in range(interface_count)])}"
                 }
-
-        call = api.path(
-            "/interface"
-        )
-        call_results = tuple(call)
+            ))
+            for result in call_results:
+                if "rate" in result:
+                    interface_ethernet_data[result["name"]] = {
+                        "speed": result["rate"],
+                    }
+
+            call = api.path(
+                "/interface"
+            )
+            call_results = tuple(call)
 
         self._interface_data = {}
         for result in call_results:
@@ -47,13 +47,12 @@ class InterfaceGREResource(RouterOSCheckResource):
         if self._interface_data:
             return self._interface_data
 
-        api = self._connect_api()
-
-        logger.info("Fetching data ...")
-        call = api.path(
-            "/interface/gre"
-        )
-        call_results = tuple(call)
+        with self._api_connection() as api:
+            logger.info("Fetching data ...")
+            call = api.path(
+                "/interface/gre"
+            )
+            call_results = tuple(call)
 
         self._interface_data = {}
         for result in call_results:
@@ -29,23 +29,24 @@ class InterfaceVrrpCheck(RouterOSCheckResource):
 
     def probe(self):
         key_name = librouteros.query.Key("name")
-        api = self._connect_api()
-
-        logger.info("Fetching data ...")
-        call = api.path(
-            "/interface/vrrp"
-        ).select(
-            key_name,
-            librouteros.query.Key("backup"),
-            librouteros.query.Key("disabled"),
-            librouteros.query.Key("invalid"),
-            librouteros.query.Key("master"),
-            librouteros.query.Key("running"),
-        ).where(
-            key_name == self._name
-        )
-        results = tuple(call)
-        result = results[0]
+        with self._api_connection() as api:
+            logger.info("Fetching data ...")
+            call = api.path(
+                "/interface/vrrp"
+            ).select(
+                key_name,
+                librouteros.query.Key("backup"),
+                librouteros.query.Key("disabled"),
+                librouteros.query.Key("invalid"),
+                librouteros.query.Key("master"),
+                librouteros.query.Key("running"),
+            ).where(
+                key_name == self._name
+            )
+            result = next(iter(call), None)
+
+        if result is None:
+            raise nagiosplugin.CheckError(f"Unable to find VRRP interface '{self._name}'")
 
         self.disabled = result["disabled"]
         self.enabled = not self.disabled
@@ -49,13 +49,12 @@ class RoutingBGPPeerResource(RouterOSCheckResource):
         if self._peer_data:
             return self._peer_data
 
-        api = self._connect_api()
-
-        logger.info("Fetching data ...")
-        call = api.path(
-            "/routing/bgp/peer"
-        )
-        call_results = tuple(call)
+        with self._api_connection() as api:
+            logger.info("Fetching data ...")
+            call = api.path(
+                "/routing/bgp/peer"
+            )
+            call_results = tuple(call)
 
         self._peer_data = {}
         for result in call_results:
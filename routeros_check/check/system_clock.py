@@ -27,14 +27,13 @@ class SystemClockResource(RouterOSCheckResource):
         self._check = check
 
     def probe(self):
-        api = self._connect_api()
+        with self._api_connection() as api:
+            logger.info("Fetching clock data ...")
+            call = api.path(
+                "/system/clock"
+            )
 
-        logger.info("Fetching clock data ...")
-        call = api.path(
-            "/system/clock"
-        )
-
-        results = tuple(call)
+            results = tuple(call)
 
         result = results[0]
         logger.debug(f"Extracted values {pformat(result)}")
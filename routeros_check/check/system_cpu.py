@@ -47,17 +47,23 @@ class SystemCpuResource(RouterOSCheckResource):
 
     def probe(self):
         key_cpu_load = librouteros.query.Key("cpu-load")
-        api = self._connect_api()
+        with self._api_connection() as api:
+            logger.info("Fetching global data ...")
+            call = api.path(
+                "/system/resource"
+            ).select(
+                key_cpu_load
+            )
+            results = tuple(call)
+            result = results[0]
+            logger.debug(f"Extracted values {pformat(result)}")
 
-        logger.info("Fetching global data ...")
-        call = api.path(
-            "/system/resource"
-        ).select(
-            key_cpu_load
-        )
-        results = tuple(call)
-        result = results[0]
-        logger.debug(f"Extracted values {pformat(result)}")
+            logger.info("Fetching cpu data ...")
+            call = api.path(
+                "/system/resource/cpu"
+            )
+            results = tuple(call)
+            logger.debug(f"Extracted values {pformat(results)}")
 
         yield nagiosplugin.Metric(
             name="cpu-load",
@@ -67,13 +73,6 @@ class SystemCpuResource(RouterOSCheckResource):
             max=100,
         )
 
-        logger.info("Fetching cpu data ...")
-        call = api.path(
-            "/system/resource/cpu"
-        )
-        results = tuple(call)
-        logger.debug(f"Extracted values {pformat(results)}")
-
         for cpu in results:
             name = cpu["cpu"]
             for value_name_suffix in ("load", "irq", "disk"):
@@ -28,17 +28,16 @@ class SystemDiskResource(RouterOSCheckResource):
         ]
 
     def probe(self):
-        api = self._connect_api()
-
-        logger.info("Fetching data ...")
-        call = api.path(
-            "/system/resource"
-        ).select(
-            librouteros.query.Key("free-hdd-space"),
-            librouteros.query.Key("total-hdd-space"),
-            *self.get_routeros_select_keys()
-        )
-        api_result_items = tuple(call)
+        with self._api_connection() as api:
+            logger.info("Fetching data ...")
+            call = api.path(
+                "/system/resource"
+            ).select(
+                librouteros.query.Key("free-hdd-space"),
+                librouteros.query.Key("total-hdd-space"),
+                *self.get_routeros_select_keys()
+            )
+            api_result_items = tuple(call)
 
         free_hdd_space = api_result_items[0]["free-hdd-space"]
         self.total_hdd_space = api_result_items[0]["total-hdd-space"]
@@ -4,13 +4,10 @@
 from typing import List
 
 import click
-import librouteros
-import librouteros.query
 import nagiosplugin
 
 from ..cli import cli
 from ..context import ScalarPercentContext
-from ..helper import logger
 from ..resource import RouterOSCheckResource
 
 
@@ -23,17 +20,7 @@ class SystemMemoryResource(RouterOSCheckResource):
         self.memory_total = None
 
     def probe(self):
-        api = self._connect_api()
-
-        logger.info("Fetching data ...")
-        call = api.path(
-            "/system/resource"
-        ).select(
-            librouteros.query.Key("free-memory"),
-            librouteros.query.Key("total-memory")
-        )
-        results = tuple(call)
-        result = results[0]
+        result = self.get_system_resource()
 
         memory_free = result["free-memory"]
         self.memory_total = result["total-memory"]
@@ -99,14 +86,14 @@ def system_memory(ctx, used, warning, critical):
         ))
         check.add(ScalarPercentContext(
             name="used",
-            total_name="memory_total",
+            total_provider=lambda resource: resource.memory_total,
             warning=warning,
             critical=critical
         ))
     else:
         check.add(ScalarPercentContext(
             name="free",
-            total_name="memory_total",
+            total_provider=lambda resource: resource.memory_total,
             warning=f"{warning}:",
             critical=f"{critical}:"
         ))
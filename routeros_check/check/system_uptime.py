@@ -2,13 +2,11 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 import click
-import librouteros
-import librouteros.query
 import nagiosplugin
 from nagiosplugin.state import Ok as STATE_Ok, Warn as STATE_Warn, Critical as STATE_Critical
 
 from ..cli import cli
-from ..helper import humanize_time, logger
+from ..helper import humanize_time
 from ..resource import RouterOSCheckResource
 
 
@@ -19,16 +17,7 @@ class SystemUptimeResource(RouterOSCheckResource):
         super().__init__(cmd_options=cmd_options)
 
     def probe(self):
-        api = self._connect_api()
-
-        logger.info("Fetching data ...")
-        call = api.path(
-            "/system/resource"
-        ).select(
-            librouteros.query.Key("uptime"),
-        )
-        results = tuple(call)
-        result = results[0]
+        result = self.get_system_resource()
 
         yield nagiosplugin.Metric(
             name="uptime",
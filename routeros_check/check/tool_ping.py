@@ -1,7 +1,6 @@
 # SPDX-FileCopyrightText: PhiBo DinoTools (2021)
 # SPDX-License-Identifier: GPL-3.0-or-later
 
-import re
 from typing import Optional, Tuple
 
 import click
@@ -21,20 +20,27 @@ class ToolPingCheck(RouterOSCheckResource):
         self._address = address
         self._max_packages = 1
 
-    def probe(self):
-        def strip_time(value) -> Tuple[Optional[int], Optional[str]]:
-            m = re.compile(r"^(?P<time>[0-9]+)(?P<uom>.*)$").match(value)
-            if m:
-                return int(m.group("time")), m.group("uom")
+    @staticmethod
+    def strip_time(value: str) -> Tuple[Optional[int], Optional[str]]:
+        i = 0
+        while i < len(value) and "0" <= value[i] <= "9":
+            i += 1
+        if i == 0:
             return None, None
+        return int(value[:i]), value[i:]
 
+    def probe(self):
         params = {"address": self._address, "count": self._max_packages}
-        api = self._connect_api()
+        with self._api_connection() as api:
+            logger.info("Call /ping command ...")
+            call = api("/ping", **params)
+            # Only the last reply contains the summary
+            result = None
+            for row in call:
+                result = row
 
-        logger.info("Call /ping command ...")
-        call = api("/ping", **params)
-        results = tuple(call)
-        result = results[-1]
+        if result is None:
+            raise nagiosplugin.CheckError("No reply from /ping command")
 
         yield nagiosplugin.Metric(
             name="packet_loss",
@@ -59,17 +65,17 @@ class ToolPingCheck(RouterOSCheckResource):
         if result["received"] > 0:
             yield nagiosplugin.Metric(
                 name="rtt_min",
-                value=strip_time(result["min-rtt"])[0],
+                value=self.strip_time(result["min-rtt"])[0],
                 min=0,
             )
             yield nagiosplugin.Metric(
                 name="rtt_max",
-                value=strip_time(result["max-rtt"])[0],
+                value=self.strip_time(result["max-rtt"])[0],
                 min=0,
             )
             yield nagiosplugin.Metric(
                 name="rtt_avg",
-                value=strip_time(result["avg-rtt"])[0],
+                value=self.strip_time(result["avg-rtt"])[0],
                 min=0,
             )
             yield nagiosplugin.Metric(
@@ -1,13 +1,44 @@
 # SPDX-FileCopyrightText: PhiBo DinoTools (2021)
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+import importlib
 from typing import Optional
 
 import click
 import nagiosplugin
 
+from .helper import load_modules, logger
 
-@click.group()
+
+class LazyCheckGroup(click.Group):
+    """Only import the check module required for the given command instead of all checks"""
+
+    # Commands which are not named like their module
+    command_modules = {
+        "routing.bgp.peers": "routing_bgp_peer",
+        "routing.ospf.neighbors": "routing_ospf_neighbor",
+    }
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name not in self.commands:
+            # Most checks live in a module named like the command, e.g. system.uptime -> check/system_uptime.py
+            module_name = self.command_modules.get(cmd_name, cmd_name.replace(".", "_"))
+            try:
+                importlib.import_module(f".check.{module_name}", package=__package__)
+            except ImportError:
+                logger.debug("Unable to import module for command '%s'", cmd_name, exc_info=True)
+
+        if cmd_name not in self.commands:
+            load_modules()
+
+        return super().get_command(ctx, cmd_name)
+
+    def list_commands(self, ctx):
+        load_modules()
+        return super().list_commands(ctx)
+
+
+@click.group(cls=LazyCheckGroup)
 @click.option(
     "--host",
     required=True,
@@ -75,11 +106,31 @@ import nagiosplugin
     help="Verify the SSL certificate",
 )
 @click.option("--ssl-verify-hostname/--no-ssl-verify-hostname", default=True)
+@click.option(
+    "--system-resource-cache-ttl",
+    default=10,
+    help=(
+        "Share the values from /system/resource between checks of the same device for this many seconds. "
+        "Set to 0 to disable. (Default: 10 seconds)"
+    ),
+    type=int,
+)
+@click.option(
+    "--system-resource-cache-filename",
+    default="/tmp/check_routeros_system_resource_{host}_{port}.data",
+    help=(
+        "The filename to use to share the values from /system/resource. '{host}' and '{hostname}' will be replaced "
+        "with the values provided as commandline options and '{port}' with the port used to connect. "
+        "The filename must be uniq for every device. "
+        "(Default: /tmp/check_routeros_system_resource_{host}_{port}.data)"
+    ),
+)
 @click.option("-v", "--verbose", count=True)
 @click.pass_context
 def cli(ctx, host: str, hostname: Optional[str], port: int, username: str, password: str, connection_timeout: int,
         routeros_version: str, use_ssl: bool, ssl_cafile: Optional[str], ssl_capath: Optional[str],
-        ssl_force_no_certificate: bool, ssl_verify: bool, ssl_verify_hostname: bool, verbose: int):
+        ssl_force_no_certificate: bool, ssl_verify: bool, ssl_verify_hostname: bool,
+        system_resource_cache_ttl: int, system_resource_cache_filename: str, verbose: int):
     ctx.ensure_object(dict)
     ctx.obj["host"] = host
     ctx.obj["hostname"] = hostname
@@ -95,6 +146,8 @@ def cli(ctx, host: str, hostname: Optional[str], port: int, username: str, passw
     ctx.obj["ssl_force_no_certificate"] = ssl_force_no_certificate
     ctx.obj["ssl_verify"] = ssl_verify
     ctx.obj["ssl_verify_hostname"] = ssl_verify_hostname
+    ctx.obj["system_resource_cache_ttl"] = system_resource_cache_ttl
+    ctx.obj["system_resource_cache_filename"] = system_resource_cache_filename
     ctx.obj["verbose"] = verbose
 
     runtime = nagiosplugin.Runtime()
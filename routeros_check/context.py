@@ -1,20 +1,27 @@
 # SPDX-FileCopyrightText: PhiBo DinoTools (2021)
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+import functools
 import re
-from typing import Optional, Union
+from typing import Callable, Optional, Union
 
 import nagiosplugin
 from nagiosplugin.state import Ok as STATE_Ok, Warn as STATE_Warn, Critical as STATE_Critical
 
 
 class BooleanContext(nagiosplugin.Context):
-    def performance(self, metric, resource):
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _get_performance(label: str, value: int) -> nagiosplugin.performance.Performance:
+        # Performance is a namedtuple, so it is safe to share the instances
         return nagiosplugin.performance.Performance(
-            label=metric.name,
-            value=1 if metric.value else 0
+            label=label,
+            value=value
         )
 
+    def performance(self, metric, resource):
+        return self._get_performance(metric.name, 1 if metric.value else 0)
+
 
 class PerfdataScalarContext(nagiosplugin.ScalarContext):
     def evaluate(self, metric, resource):
@@ -53,36 +60,47 @@ class SimplePositiveFloatContext(nagiosplugin.ScalarContext):
 
 
 class ScalarPercentContext(nagiosplugin.ScalarContext):
+    regex_percent = re.compile(r"(?P<value>[\d.]+)(?P<unit>[%])")
+
     def __init__(self, name, total_name: Optional[str] = None, total_value: Optional[Union[int, float]] = None,
-                 warning=None, critical=None, fmt_metric='{name} is {valueunit}', result_cls=nagiosplugin.Result):
+                 warning=None, critical=None, fmt_metric='{name} is {valueunit}', result_cls=nagiosplugin.Result,
+                 total_provider: Optional[Callable[[nagiosplugin.Resource], Union[int, float]]] = None):
         super(ScalarPercentContext, self).__init__(name, fmt_metric=fmt_metric, result_cls=result_cls)
 
         self._warning = warning
         self._critical = critical
         self._total_name = total_name
+        self._total_provider = total_provider
         self._total_value = total_value
-        if self._total_value is None and self._total_name is None:
-            raise ValueError("At least total_value or total_name must be given.")
+        if self._total_value is None and self._total_provider is None and self._total_name is None:
+            raise ValueError("At least total_value, total_provider or total_name must be given.")
         self.warning = nagiosplugin.Range(None)
         self.critical = nagiosplugin.Range(None)
 
-    def _prepare_ranges(self, metric, resource):
+    @classmethod
+    @functools.lru_cache(maxsize=32)
+    def _resolve_range(cls, threshold: str, total_value: Union[int, float]) -> nagiosplugin.Range:
         def replace(m):
             if m.group("unit") == "%":
                 return str(float(total_value) * (float(m.group("value")) / 100))
             else:
                 raise ValueError("Unable to convert type")
 
-        if self._total_value is not None:
-            total_value = self._total_value
-        else:
-            total_value = getattr(resource, self._total_name)
-        regex = re.compile(r"(?P<value>[\d.]+)(?P<unit>[%])")
+        return nagiosplugin.Range(cls.regex_percent.sub(replace, threshold))
+
+    def _prepare_ranges(self, metric, resource):
+        # Resolving the total is cheap, the parsed ranges are cached by _resolve_range()
+        total_value = self._total_value
+        if total_value is None:
+            if self._total_provider is not None:
+                total_value = self._total_provider(resource)
+            else:
+                total_value = getattr(resource, self._total_name)
 
         if self._warning is not None:
-            self.warning = nagiosplugin.Range(regex.sub(replace, self._warning))
+            self.warning = self._resolve_range(self._warning, total_value)
         if self._critical is not None:
-            self.critical = nagiosplugin.Range(regex.sub(replace, self._critical))
+            self.critical = self._resolve_range(self._critical, total_value)
 
     def evaluate(self, metric, resource):
         self._prepare_ranges(metric, resource)
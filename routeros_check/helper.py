@@ -23,9 +23,10 @@ REGEX_VERSION_PATTERN = r"""
 
 
 class RouterOSVersion:
+    regex_version = re.compile(r"^\s*" + REGEX_VERSION_PATTERN + r"\s*$", re.VERBOSE | re.IGNORECASE)
+
     def __init__(self, version_string: str):
-        regex = re.compile(r"^\s*" + REGEX_VERSION_PATTERN + r"\s*$", re.VERBOSE | re.IGNORECASE)
-        m = regex.match(version_string)
+        m = self.regex_version.match(version_string)
         if not m:
             raise ValueError(f"Unable to parse version string: '{version_string}'")
 
@@ -0,0 +1,100 @@
+# SPDX-FileCopyrightText: PhiBo DinoTools (2021)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import atexit
+import os
+import threading
+import time
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+
+import librouteros
+
+from .helper import logger
+
+
+def _get_max_size_from_env(default: int = 4) -> int:
+    value = os.environ.get("CONNECTION_POOL_MAX_SIZE")
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        logger.warning(f"Unable to parse CONNECTION_POOL_MAX_SIZE='{value}', using default {default}")
+        return default
+
+
+class ConnectionPool:
+    """
+    Keep already authenticated API connections to reuse them instead of doing a new (TLS) handshake and login.
+
+    Connections are handed out LIFO and idle connections are closed on the next access of the pool. Connections that
+    are handed out are tracked until they are released or discarded, so close() also closes them.
+    """
+
+    def __init__(self, max_size: Optional[int] = None, idle_timeout: float = 30):
+        if max_size is None:
+            max_size = _get_max_size_from_env()
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self._connections: Dict[Hashable, List[Tuple[float, librouteros.api.Api]]] = {}
+        self._in_use: Dict[int, librouteros.api.Api] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _close_api(api: librouteros.api.Api):
+        try:
+            api.close()
+        except Exception as e:
+            logger.debug(f"Unable to close connection: {e}", exc_info=e)
+
+    def _sweep(self):
+        min_time = time.monotonic() - self.idle_timeout
+        for connections in self._connections.values():
+            while connections and connections[0][0] < min_time:
+                logger.debug("Closing idle connection")
+                self._close_api(connections.pop(0)[1])
+
+    def acquire(self, key: Hashable, connect: Callable[[], librouteros.api.Api]) -> librouteros.api.Api:
+        api: Optional[librouteros.api.Api] = None
+        with self._lock:
+            self._sweep()
+            connections = self._connections.get(key)
+            if connections:
+                logger.debug("Reusing connection")
+                api = connections.pop()[1]
+
+        if api is None:
+            api = connect()
+
+        with self._lock:
+            self._in_use[id(api)] = api
+        return api
+
+    def release(self, key: Hashable, api: librouteros.api.Api):
+        with self._lock:
+            self._in_use.pop(id(api), None)
+            self._sweep()
+            connections = self._connections.setdefault(key, [])
+            if len(connections) < self.max_size:
+                connections.append((time.monotonic(), api))
+                return
+        self._close_api(api)
+
+    def discard(self, api: librouteros.api.Api):
+        with self._lock:
+            self._in_use.pop(id(api), None)
+        self._close_api(api)
+
+    def close(self):
+        with self._lock:
+            for connections in self._connections.values():
+                for _, api in connections:
+                    self._close_api(api)
+            self._connections.clear()
+            for api in self._in_use.values():
+                self._close_api(api)
+            self._in_use.clear()
+
+
+connection_pool = ConnectionPool()
+atexit.register(connection_pool.close)
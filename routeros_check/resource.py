@@ -1,17 +1,21 @@
 # SPDX-FileCopyrightText: PhiBo DinoTools (2021)
 # SPDX-License-Identifier: GPL-3.0-or-later
+import contextlib
 from datetime import date, datetime, time
 from decimal import Decimal
+import functools
+from pprint import pformat
 import re
 import ssl
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 import librouteros
 import librouteros.query
 import nagiosplugin
 
-from .helper import logger, RouterOSVersion
+from .helper import escape_filename, logger, RouterOSVersion
 from .exeption import MissingValue
+from .pool import connection_pool
 
 
 class RouterOSCheckResource(nagiosplugin.Resource):
@@ -50,11 +54,14 @@ class RouterOSCheckResource(nagiosplugin.Resource):
         flags=re.IGNORECASE
     )
 
+    regex_speed = re.compile(r"(?P<value>\d+)(?P<factor>[A-Z]*)bps")
+
     def __init__(self, cmd_options: Dict[str, Any]):
         self._cmd_options = cmd_options
         self._routeros_metric_values: List[Dict[str, Any]] = []
         self._routeros_version: Optional[RouterOSVersion] = None
         self._api: Optional[librouteros.api.Api] = None
+        self._system_resource: Optional[Dict[str, Any]] = None
         self.current_time = datetime.now()
 
     @property
@@ -91,6 +98,9 @@ class RouterOSCheckResource(nagiosplugin.Resource):
         return (cur_value - old_value) / elapsed_seconds * factor
 
     def _connect_api(self) -> librouteros.api.Api:
+        return connection_pool.acquire(self._get_connection_pool_key(), self._create_api)
+
+    def _create_api(self) -> librouteros.api.Api:
         def wrap_socket(socket):
             server_hostname: Optional[str] = self._cmd_options["hostname"]
             if server_hostname is None:
@@ -98,44 +108,95 @@ class RouterOSCheckResource(nagiosplugin.Resource):
             return ssl_ctx.wrap_socket(socket, server_hostname=server_hostname)
 
         logger.info("Connecting to device ...")
-        port = self._cmd_options["port"]
         extra_kwargs = {}
         if self._cmd_options["ssl"]:
-            if port is None:
-                port = 8729
-
-            context_kwargs = {}
-            if self._cmd_options["ssl_cafile"]:
-                context_kwargs["cafile"] = self._cmd_options["ssl_cafile"]
-            if self._cmd_options["ssl_capath"]:
-                context_kwargs["capath"] = self._cmd_options["ssl_capath"]
-
-            ssl_ctx = ssl.create_default_context(**context_kwargs)
-
-            if self._cmd_options["ssl_force_no_certificate"]:
-                ssl_ctx.check_hostname = False
-                ssl_ctx.set_ciphers("ADH:@SECLEVEL=0")
-            elif not self._cmd_options["ssl_verify"]:
-                # We have do disable hostname check if we disable certificate verification
-                ssl_ctx.check_hostname = False
-                ssl_ctx.verify_mode = ssl.CERT_NONE
-            elif not self._cmd_options["ssl_verify_hostname"]:
-                ssl_ctx.check_hostname = False
-
+            ssl_ctx = self._get_ssl_context()
             extra_kwargs["ssl_wrapper"] = wrap_socket
-        else:
-            if port is None:
-                port = 8728
 
         api = librouteros.connect(
             host=self._cmd_options["host"],
             username=self._cmd_options["username"],
             password=self._cmd_options["password"],
-            port=port,
+            port=self._get_port(),
             **extra_kwargs
         )
         return api
 
+    @staticmethod
+    @functools.lru_cache(maxsize=16)
+    def _build_ssl_context(
+            cafile: Optional[str],
+            capath: Optional[str],
+            force_no_certificate: bool,
+            verify: bool,
+            verify_hostname: bool
+    ) -> ssl.SSLContext:
+        # Loading the CA certificates is expensive, so the context is shared and must not be modified afterwards
+        ssl_ctx = ssl.create_default_context(cafile=cafile or None, capath=capath or None)
+
+        if force_no_certificate:
+            ssl_ctx.check_hostname = False
+            ssl_ctx.set_ciphers("ADH:@SECLEVEL=0")
+        elif not verify:
+            # We have do disable hostname check if we disable certificate verification
+            ssl_ctx.check_hostname = False
+            ssl_ctx.verify_mode = ssl.CERT_NONE
+        elif not verify_hostname:
+            ssl_ctx.check_hostname = False
+
+        return ssl_ctx
+
+    def _get_ssl_context(self) -> ssl.SSLContext:
+        return self._build_ssl_context(
+            cafile=self._cmd_options["ssl_cafile"],
+            capath=self._cmd_options["ssl_capath"],
+            force_no_certificate=self._cmd_options["ssl_force_no_certificate"],
+            verify=self._cmd_options["ssl_verify"],
+            verify_hostname=self._cmd_options["ssl_verify_hostname"],
+        )
+
+    def _get_connection_pool_key(self) -> Tuple[Any, ...]:
+        # A connection must only be reused with the same credentials and the same TLS settings
+        return (
+            self._cmd_options["host"],
+            self._get_port(),
+            self._cmd_options["username"],
+            self._cmd_options["password"],
+            self._cmd_options["ssl"],
+            self._cmd_options["hostname"],
+            self._cmd_options["ssl_cafile"],
+            self._cmd_options["ssl_capath"],
+            self._cmd_options["ssl_force_no_certificate"],
+            self._cmd_options["ssl_verify"],
+            self._cmd_options["ssl_verify_hostname"],
+        )
+
+    def _get_port(self) -> int:
+        port = self._cmd_options["port"]
+        if port is None:
+            return 8729 if self._cmd_options["ssl"] else 8728
+        return int(port)
+
+    def _release_api(self, api: librouteros.api.Api):
+        """Hand a connection from _connect_api() back, the pool closes it if it is not needed anymore"""
+        connection_pool.release(self._get_connection_pool_key(), api)
+
+    def _discard_api(self, api: librouteros.api.Api):
+        """Close a connection from _connect_api() that failed, it might be in an unknown state"""
+        connection_pool.discard(api)
+
+    @contextlib.contextmanager
+    def _api_connection(self) -> Iterator[librouteros.api.Api]:
+        """Borrow a connection from the pool, it is handed back on success and closed on error"""
+        api = self._connect_api()
+        try:
+            yield api
+        except BaseException:
+            self._discard_api(api)
+            raise
+        else:
+            self._release_api(api)
+
     @staticmethod
     def _convert_v6_list_to_v7(api_results) -> List[Dict[str, Any]]:
         result_items = []
@@ -146,6 +207,18 @@ class RouterOSCheckResource(nagiosplugin.Resource):
             })
         return result_items
 
+    def _fetch_system_resource(self) -> Dict[str, Any]:
+        with self._api_connection() as api:
+            logger.info("Fetching system resource data ...")
+            call = api.path(
+                "/system/resource"
+            )
+            result = next(iter(call), None)
+
+        if result is None:
+            raise nagiosplugin.CheckError("Unable to fetch system resource data")
+        return result
+
     def _get_routeros_version(self) -> RouterOSVersion:
         call = self.api.path(
             "/system/resource"
@@ -162,6 +235,44 @@ class RouterOSCheckResource(nagiosplugin.Resource):
 
         return self._api
 
+    def get_system_resource(self) -> Dict[str, Any]:
+        """Get the values from /system/resource, shared with other checks of the same device for a short time"""
+        if self._system_resource is not None:
+            return self._system_resource
+
+        cache_ttl = self._cmd_options["system_resource_cache_ttl"]
+        if not cache_ttl:
+            self._system_resource = self._fetch_system_resource()
+            return self._system_resource
+
+        format_values = {}
+        for n in ["host", "hostname"]:
+            format_values[n] = escape_filename(str(self._cmd_options.get(n)))
+        format_values["port"] = str(self._get_port())
+        cookie_filename = self._cmd_options["system_resource_cache_filename"].format(**format_values)
+
+        # Only read the cookie here, committing it would rewrite the file on every run
+        cookie = nagiosplugin.Cookie(cookie_filename)
+        try:
+            cookie.open()
+        finally:
+            cookie.close()
+
+        cached_time = cookie.get("time")
+        if isinstance(cached_time, (int, float)) and 0 <= datetime.now().timestamp() - cached_time < cache_ttl:
+            logger.info("Using cached system resource data")
+            self._system_resource = cookie["data"]
+            return self._system_resource
+
+        # Fetch the data without holding the lock, so other checks are not blocked by the request
+        fetch_time = datetime.now().timestamp()
+        self._system_resource = self._fetch_system_resource()
+        with nagiosplugin.Cookie(cookie_filename) as cookie:
+            cookie["time"] = fetch_time
+            cookie["data"] = self._system_resource
+
+        return self._system_resource
+
     @classmethod
     def parse_routeros_date(cls, date_string: str) -> date:
         logger.debug(f"Parsing date string {date_string}")
@@ -212,8 +323,8 @@ class RouterOSCheckResource(nagiosplugin.Resource):
             second=int(m.group("second"))
         )
 
-    @staticmethod
-    def parse_routeros_speed(value_string: str) -> int:
+    @classmethod
+    def parse_routeros_speed(cls, value_string: str) -> int:
         factors = {
             "": 1,
             "K": 1000,
@@ -221,7 +332,7 @@ class RouterOSCheckResource(nagiosplugin.Resource):
             "G": 1000 * 1000 * 1000,
         }
 
-        m = re.compile(r"(?P<value>\d+)(?P<factor>[A-Z]*)bps").match(value_string)
+        m = cls.regex_speed.match(value_string)
         if not m:
             raise ValueError(f"Unable to parse speed string: '{value_string}'")
 
@@ -259,11 +370,26 @@ class RouterOSCheckResource(nagiosplugin.Resource):
         value_is_negativ = time_string.startswith("-")
 
         seconds = Decimal(0)
-        for m in re.compile(r"(?P<value>\d+)(?P<type>[a-z]+)").finditer(time_string):
-            factor = factors.get(m.group("type"))
-            if factor is None:
-                raise ValueError(f"Unable to parse element '{m.group()}' of time string: '{time_string}'")
-            seconds += int(m.group("value")) * factor
+        value = ""
+        unit = ""
+        # Walk the string once and split it into <digits><unit> pairs, a trailing space flushes the last pair
+        for c in time_string + " ":
+            if "a" <= c <= "z" and value:
+                unit += c
+                continue
+
+            if unit:
+                factor = factors.get(unit)
+                if factor is None:
+                    raise ValueError(f"Unable to parse element '{value}{unit}' of time string: '{time_string}'")
+                seconds += int(value) * factor
+                value = ""
+                unit = ""
+
+            if "0" <= c <= "9":
+                value += c
+            else:
+                value = ""
 
         seconds_float = float(round(seconds, 6))
 
@@ -417,8 +543,7 @@ class RouterOSCheckResource(nagiosplugin.Resource):
                 elapsed_seconds = delta_time.total_seconds()
 
         if isinstance(api_results, dict):
-            from pprint import pprint
-            pprint(api_results)
+            logger.debug(f"Converting RouterOS 6 values {pformat(api_results)}")
             api_results = self._convert_v6_list_to_v7(api_results=api_results)
 
         #
@@ -2,9 +2,21 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 from datetime import date, datetime
 
+import pytest
+
 from routeros_check.resource import RouterOSCheckResource
 
 
+class SystemResourceCheck(RouterOSCheckResource):
+    def __init__(self, cmd_options):
+        super().__init__(cmd_options=cmd_options)
+        self.fetch_count = 0
+
+    def _fetch_system_resource(self):
+        self.fetch_count += 1
+        return {"uptime": "1h"}
+
+
 class TestBase:
     def test_parse_date(self):
         check = RouterOSCheckResource(cmd_options={})
@@ -65,3 +77,37 @@ class TestBase:
             4 * 24 * 60 * 60 +
             5 * 7 * 24 * 60 * 60
         )
+        assert check.parse_routeros_time_duration("") == 0
+
+        with pytest.raises(ValueError):
+            check.parse_routeros_time_duration("5x")
+
+    def test_get_system_resource(self, tmp_path):
+        cmd_options = {
+            "host": "192.0.2.1",
+            "port": None,
+            "ssl": True,
+            "system_resource_cache_ttl": 10,
+            "system_resource_cache_filename": str(tmp_path / "{host}_{port}.data"),
+        }
+        check = SystemResourceCheck(cmd_options=cmd_options)
+        assert check.get_system_resource()["uptime"] == "1h"
+        assert check.fetch_count == 1
+        cache_mtime = (tmp_path / "192_0_2_1_8729.data").stat().st_mtime_ns
+
+        # The cache file is only read on a hit
+        check = SystemResourceCheck(cmd_options=cmd_options)
+        assert check.get_system_resource()["uptime"] == "1h"
+        assert check.fetch_count == 0
+        assert (tmp_path / "192_0_2_1_8729.data").stat().st_mtime_ns == cache_mtime
+
+        # Another device behind the same address must not use the cached values
+        check = SystemResourceCheck(cmd_options=dict(cmd_options, port="18729"))
+        assert check.get_system_resource()["uptime"] == "1h"
+        assert check.fetch_count == 1
+        assert (tmp_path / "192_0_2_1_8729.data").exists()
+        assert (tmp_path / "192_0_2_1_18729.data").exists()
+
+        check = SystemResourceCheck(cmd_options=dict(cmd_options, system_resource_cache_ttl=0))
+        assert check.get_system_resource()["uptime"] == "1h"
+        assert check.fetch_count == 1
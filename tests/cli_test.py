@@ -0,0 +1,38 @@
+# SPDX-FileCopyrightText: PhiBo DinoTools (2021)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import subprocess
+import sys
+
+import pytest
+
+# Run in a new interpreter, other tests might already have imported check modules
+GET_COMMAND_SCRIPT = """
+import sys
+import click
+from routeros_check.cli import cli
+command = cli.get_command(click.Context(cli), sys.argv[1])
+assert command is not None and command.name == sys.argv[1]
+print(",".join(sorted(m for m in sys.modules if m.startswith("routeros_check.check."))))
+"""
+
+
+class TestLazyCheckGroup:
+    @pytest.mark.parametrize("command_name, module_name", [
+        ("interface", "interface"),
+        ("system.uptime", "system_uptime"),
+        ("routing.bgp.peers", "routing_bgp_peer"),
+        ("routing.ospf.neighbors", "routing_ospf_neighbor"),
+    ])
+    def test_get_command_imports_only_target_module(self, command_name, module_name):
+        output = subprocess.check_output(
+            [sys.executable, "-c", GET_COMMAND_SCRIPT, command_name],
+            text=True,
+        )
+        assert output.strip() == f"routeros_check.check.{module_name}"
+
+    def test_list_commands(self):
+        import click
+        from routeros_check.cli import cli
+
+        assert "routing.ospf.neighbors" in cli.list_commands(click.Context(cli))
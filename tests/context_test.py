@@ -0,0 +1,65 @@
+# SPDX-FileCopyrightText: PhiBo DinoTools (2021)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import nagiosplugin
+
+from routeros_check.context import BooleanContext, ScalarPercentContext
+
+
+class MemoryResource(nagiosplugin.Resource):
+    def __init__(self, memory_total):
+        self.memory_total = memory_total
+
+
+class TestBooleanContext:
+    def test_performance(self):
+        context = BooleanContext("running")
+        assert str(context.performance(nagiosplugin.Metric(name="running", value=True), None)) == "running=1"
+        assert str(context.performance(nagiosplugin.Metric(name="running", value=False), None)) == "running=0"
+        assert str(context.performance(nagiosplugin.Metric(name="running", value=None), None)) == "running=0"
+
+
+class TestScalarPercentContext:
+    def test_percent_thresholds(self):
+        context = ScalarPercentContext(
+            name="used",
+            total_provider=lambda resource: resource.memory_total,
+            warning="80%",
+            critical="90%",
+        )
+        metric = nagiosplugin.Metric(name="used", value=850, context="used")
+        result = context.evaluate(metric, MemoryResource(memory_total=1000))
+        assert result.state == nagiosplugin.state.Warn
+        assert str(context.warning) == "800.0"
+        assert str(context.critical) == "900.0"
+        assert str(context.performance(metric, MemoryResource(memory_total=1000))) == "used=850;800.0;900.0"
+
+    def test_total_name(self):
+        context = ScalarPercentContext(
+            name="used",
+            total_name="memory_total",
+            warning="80%",
+        )
+        metric = nagiosplugin.Metric(name="used", value=850, context="used")
+        result = context.evaluate(metric, MemoryResource(memory_total=1000))
+        assert result.state == nagiosplugin.state.Warn
+        assert str(context.warning) == "800.0"
+
+        # The total is looked up from the given resource every time
+        result = context.evaluate(metric, MemoryResource(memory_total=2000))
+        assert result.state == nagiosplugin.state.Ok
+        assert str(context.warning) == "1600.0"
+        assert context._total_value is None
+
+    def test_absolute_thresholds(self):
+        context = ScalarPercentContext(
+            name="free",
+            total_value=1000,
+            warning="200:",
+            critical="10%:",
+        )
+        metric = nagiosplugin.Metric(name="free", value=50, context="free")
+        result = context.evaluate(metric, None)
+        assert result.state == nagiosplugin.state.Critical
+        assert str(context.warning) == "200:"
+        assert str(context.critical) == "100.0:"
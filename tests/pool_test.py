@@ -0,0 +1,128 @@
+# SPDX-FileCopyrightText: PhiBo DinoTools (2021)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import librouteros.exceptions
+import pytest
+
+from routeros_check.pool import ConnectionPool
+from routeros_check.resource import RouterOSCheckResource
+
+
+class FakeApi:
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class BrokenApi(FakeApi):
+    def path(self, *path):
+        raise librouteros.exceptions.ConnectionClosed("Connection unexpectedly closed.")
+
+
+class BrokenApiResource(RouterOSCheckResource):
+    def _create_api(self):
+        return BrokenApi()
+
+
+CMD_OPTIONS = {
+    "host": "192.0.2.1",
+    "hostname": None,
+    "port": None,
+    "username": "monitoring",
+    "password": "secret",
+    "ssl": True,
+    "ssl_cafile": None,
+    "ssl_capath": None,
+    "ssl_force_no_certificate": False,
+    "ssl_verify": True,
+    "ssl_verify_hostname": True,
+}
+
+
+class TestConnectionPool:
+    def test_max_size_from_env(self, monkeypatch):
+        monkeypatch.setenv("CONNECTION_POOL_MAX_SIZE", "2")
+        assert ConnectionPool().max_size == 2
+
+        monkeypatch.setenv("CONNECTION_POOL_MAX_SIZE", "two")
+        assert ConnectionPool().max_size == 4
+
+    def test_acquire_release(self):
+        pool = ConnectionPool(max_size=2)
+        api1 = pool.acquire("a", FakeApi)
+        api2 = pool.acquire("a", FakeApi)
+        assert api1 is not api2
+
+        pool.release("a", api1)
+        pool.release("a", api2)
+        assert pool.acquire("b", FakeApi) not in (api1, api2)
+        # LIFO
+        assert pool.acquire("a", FakeApi) is api2
+        assert pool.acquire("a", FakeApi) is api1
+        assert pool.acquire("a", FakeApi) not in (api1, api2)
+        assert not api1.closed and not api2.closed
+
+    def test_max_size(self):
+        pool = ConnectionPool(max_size=1)
+        api1 = pool.acquire("a", FakeApi)
+        api2 = pool.acquire("a", FakeApi)
+        pool.release("a", api1)
+        pool.release("a", api2)
+        assert api2.closed
+        assert pool.acquire("a", FakeApi) is api1
+
+    def test_idle_timeout(self):
+        pool = ConnectionPool(max_size=1, idle_timeout=-1)
+        api = pool.acquire("a", FakeApi)
+        pool.release("a", api)
+        assert pool.acquire("a", FakeApi) is not api
+        assert api.closed
+
+    def test_close(self):
+        pool = ConnectionPool()
+        api = pool.acquire("a", FakeApi)
+        pool.release("a", api)
+        pool.close()
+        assert api.closed
+        assert pool.acquire("a", FakeApi) is not api
+
+    def test_close_in_use(self):
+        pool = ConnectionPool()
+        api = pool.acquire("a", FakeApi)
+        pool.close()
+        assert api.closed
+
+    def test_discard(self):
+        pool = ConnectionPool()
+        api = pool.acquire("a", FakeApi)
+        pool.discard(api)
+        assert api.closed
+        pool.close()
+        assert pool.acquire("a", FakeApi) is not api
+
+    def test_failed_connection_is_not_pooled(self):
+        check = BrokenApiResource(cmd_options=CMD_OPTIONS)
+        api = check._connect_api()
+        assert isinstance(api, BrokenApi)
+        check._release_api(api)
+
+        with pytest.raises(librouteros.exceptions.ConnectionClosed):
+            check._fetch_system_resource()
+        assert api.closed
+        assert check._connect_api() is not api
+
+    def test_connection_pool_key(self):
+        key = RouterOSCheckResource(cmd_options=CMD_OPTIONS)._get_connection_pool_key()
+        assert RouterOSCheckResource(cmd_options=dict(CMD_OPTIONS))._get_connection_pool_key() == key
+        for name, value in [
+            ("password", "other"),
+            ("hostname", "router.example.org"),
+            ("ssl_cafile", "/tmp/ca.pem"),
+            ("ssl_force_no_certificate", True),
+            ("ssl_verify", False),
+            ("ssl_verify_hostname", False),
+        ]:
+            check = RouterOSCheckResource(cmd_options=dict(CMD_OPTIONS, **{name: value}))
+            assert check._get_connection_pool_key() != key